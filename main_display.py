@@ -3,11 +3,12 @@ from PyQt5.QtCore import QSize, Qt, QTimer, QEvent, QPropertyAnimation, QEasingC
 from PyQt5.QtGui import QFontDatabase, QColor, QPalette, QPixmap, QPainter, QIcon
 from MetroAPI import MetroAPI, MetroAPIError
 from data_handler import DataHandler
-from services.config_store import ConfigStore
+from services.config_store import ConfigStore, parse_reboot_time
 from services.message_store import MessageStore
 from services.settings_server_client import SettingsServerClient
 from services.system_service import SystemService
 from services.update_service import UpdateService
+from views.common import pin_label_width, set_stylesheet_if_changed
 from views.filters import TouchscreenComboViewFilter
 from views.popouts import IPPopout, UpdatePopout, ShutdownPopout
 import os
@@ -438,12 +439,11 @@ class MainWindow(QMainWindow):
     
     def configure_combo_for_touchscreen(self, combo_box):
         """Configure a QComboBox for touchscreen use by installing an event filter on its view"""
-        # Create and store the event filter
-        if not hasattr(self, '_combo_filters'):
-            self._combo_filters = {}
+        # A single filter instance is shared by every combo box
+        if not hasattr(self, '_combo_view_filter'):
+            self._combo_view_filter = TouchscreenComboViewFilter(self)
         
-        filter_obj = TouchscreenComboViewFilter(combo_box)
-        self._combo_filters[combo_box] = filter_obj
+        filter_obj = self._combo_view_filter
         
         # Override showPopup to install the filter on the view when it opens
         original_show_popup = combo_box.showPopup
@@ -451,9 +451,7 @@ class MainWindow(QMainWindow):
         def show_popup_wrapper():
             original_show_popup()
             # Install the filter on the view after the popup is shown
-            view = combo_box.view()
-            if view:
-                view.installEventFilter(filter_obj)
+            filter_obj.attach(combo_box)
         
         combo_box.showPopup = show_popup_wrapper
     
@@ -1155,13 +1153,17 @@ class MainWindow(QMainWindow):
             self.refresh_countdown_label.setText(
                 f"Error Refreshing: {self.refresh_error_message} Trying again in {time_display}"
             )
-            self.refresh_countdown_label.setStyleSheet(
+            set_stylesheet_if_changed(
+                self.refresh_countdown_label,
                 f"font-family: {self.font_family}; font-size: 14px; color: white; background-color: #e74c3c; padding: 5px; border-radius: 3px;"
             )
         else:
             # Normal countdown display
             self.refresh_countdown_label.setText(f"Refresh in {time_display}")
-            self.refresh_countdown_label.setStyleSheet(f"font-family: {self.font_family}; font-size: 14px; color: #666;")
+            set_stylesheet_if_changed(
+                self.refresh_countdown_label,
+                f"font-family: {self.font_family}; font-size: 14px; color: #666;"
+            )
     
     def toggle_countdown_visibility(self):
         """Toggle the visibility of the countdown label"""
@@ -1678,7 +1680,7 @@ class MainWindow(QMainWindow):
         
         try:
             # Parse the scheduled reboot time
-            reboot_time = datetime.strptime(reboot_time_str, '%I:%M %p').time()
+            reboot_time = parse_reboot_time(reboot_time_str)
             
             # Get current time
             now = datetime.now()
@@ -2505,6 +2507,12 @@ class MainWindow(QMainWindow):
         )
         self.reboot_warning_label.setAlignment(Qt.AlignCenter)
         self.reboot_warning_label.setWordWrap(False)
+        # Fixed width keeps the per-second countdown text from relaying out the banner
+        self.reboot_warning_label.setTextFormat(Qt.PlainText)
+        pin_label_width(
+            self.reboot_warning_label,
+            [f"Rebooting in {seconds} seconds" for seconds in range(61)],
+        )
         content_layout.addWidget(self.reboot_warning_label)
 
         self.reboot_cancel_button = QPushButton("Cancel")
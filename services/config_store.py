@@ -1,7 +1,10 @@
 import json
 import os
 import re
+import threading
 from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
 
 from services.file_store import atomic_write_json, file_lock
 
@@ -54,6 +57,16 @@ def _matches_reboot_time(value):
     return re.match(r"^\d{1,2}:\d{2} (AM|PM)$", value) is not None
 
 
+@lru_cache(maxsize=8)
+def parse_reboot_time(value):
+    """Parse a stored "HH:MM AM" reboot time into a datetime.time.
+
+    The setting only changes on save, so the per-second schedule check
+    reuses the parse. Raises ValueError for a malformed value.
+    """
+    return datetime.strptime(value, "%I:%M %p").time()
+
+
 def _matches_branch(value):
     if not isinstance(value, str):
         return False
@@ -161,9 +174,33 @@ def _normalize_config(raw_config):
     return normalized
 
 
+# Last normalized config and the stat stamp of the file it was read from.
+# Saves go through os.replace, so a new inode/mtime always invalidates it.
+_config_cache = {"stamp": None, "config": None}
+_config_cache_lock = threading.Lock()
+
+
+def _config_file_stamp():
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
 def load_config():
-    """Load configuration from JSON file."""
-    return _normalize_config(_read_config_raw())
+    """Load configuration from JSON file, reusing the last parse while the file is unchanged."""
+    stamp = _config_file_stamp()
+    with _config_cache_lock:
+        if stamp is not None and _config_cache["stamp"] == stamp:
+            return dict(_config_cache["config"])
+
+    config = _normalize_config(_read_config_raw())
+    if stamp is not None and stamp == _config_file_stamp():
+        with _config_cache_lock:
+            _config_cache["stamp"] = stamp
+            _config_cache["config"] = config
+    return dict(config)
 
 
 def save_config(key, value):
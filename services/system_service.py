@@ -50,22 +50,29 @@ class SystemService:
     def get_device_ip(self):
         """Get the local IP address of the device."""
         try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            ip_address = s.getsockname()[0]
-            s.close()
-            return ip_address
+            # Connecting a UDP socket only selects a route; no packet is sent
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.connect(("8.8.8.8", 80))
+                return s.getsockname()[0]
         except Exception:
             return "Unable to detect"
 
     def get_tailscale_address(self):
         """Get the Tailscale address of the device."""
         try:
+            # Only this node's status is needed; skipping peers keeps the JSON small
             result = run_command(
-                ["tailscale", "status", "--json"],
+                ["tailscale", "status", "--json", "--peers=false"],
                 timeout_s=5,
                 log_label="tailscale_status",
             )
+            if not result.ok:
+                # Older tailscale releases may not accept --peers
+                result = run_command(
+                    ["tailscale", "status", "--json"],
+                    timeout_s=5,
+                    log_label="tailscale_status",
+                )
             if result.ok and result.stdout:
                 status_data = json.loads(result.stdout)
                 dns_name = status_data.get("Self", {}).get("DNSName", "")
@@ -1,7 +1,9 @@
 """Git update workflow used by the UI."""
 
 import os
+import re
 import time
+from functools import lru_cache
 
 from PyQt5.QtCore import QObject, QProcess, pyqtSignal
 from PyQt5.QtWidgets import QApplication
@@ -13,26 +15,40 @@ from services.system_actions import run_command, start_process
 _GIT_DEBUG = True
 
 
+# Keyword scans over git output, one case-insensitive pass each
+_GIT_ERROR_RE = re.compile(r"error:|fatal:|could not|failed to|permission denied|cannot", re.IGNORECASE)
+_UP_TO_DATE_RE = re.compile(r"already up(?: to |-to-)date", re.IGNORECASE)
+_UPDATE_MARKER_RE = re.compile(r"updating|fast-forward|files? changed|insertions|deletions", re.IGNORECASE)
+_ERROR_WORD_RE = re.compile(r"error|fatal", re.IGNORECASE)
+
+# Stalled fetches should fail fast instead of using the whole timeout.
+# HTTP(S) remotes: abort below this many bytes/s for this many seconds.
+_FETCH_LOW_SPEED_LIMIT = 1000
+_FETCH_LOW_SPEED_TIME_S = 5
+# SSH remotes (set up by the web UI's key generation): drop the connection
+# once the server misses this many keepalives sent this many seconds apart
+_FETCH_SSH_ALIVE_INTERVAL_S = 5
+_FETCH_SSH_ALIVE_COUNT_MAX = 1
+_FETCH_SSH_COMMAND = (
+    f"ssh -o ServerAliveInterval={_FETCH_SSH_ALIVE_INTERVAL_S}"
+    f" -o ServerAliveCountMax={_FETCH_SSH_ALIVE_COUNT_MAX}"
+)
+
+
 def has_git_error(output_text):
     if not output_text:
         return False
-    lower = output_text.lower()
-    for token in ("error:", "fatal:", "could not", "failed to", "permission denied", "cannot"):
-        if token in lower:
-            return True
-    return False
+    return _GIT_ERROR_RE.search(output_text) is not None
 
 
 def has_updates(output_text):
     if not output_text:
         return False
-    lower = output_text.lower()
-    if "already up to date" in lower or "already up-to-date" in lower:
+    if _UP_TO_DATE_RE.search(output_text):
         return False
-    for token in ("updating", "fast-forward", "files changed", "file changed", "insertions", "deletions"):
-        if token in lower:
-            return True
-    if "error" not in lower and "fatal" not in lower:
+    if _UPDATE_MARKER_RE.search(output_text):
+        return True
+    if not _ERROR_WORD_RE.search(output_text):
         lines = [ln.strip() for ln in output_text.split("\n") if ln.strip()]
         substantial = [ln for ln in lines if not ln.startswith("From") and not ln.startswith("remote:")]
         if len(substantial) > 1:
@@ -40,8 +56,19 @@ def has_updates(output_text):
     return False
 
 
+@lru_cache(maxsize=1)
+def _effective_username():
+    try:
+        import pwd
+
+        return pwd.getpwuid(os.geteuid()).pw_name
+    except Exception:
+        return None
+
+
 def build_git_command(args, git_user=None):
-    if git_user:
+    # sudo is only needed to switch users; running git as ourselves skips a PAM pass
+    if git_user and git_user != _effective_username():
         return ["sudo", "-u", git_user, "git"] + list(args)
     return ["git"] + list(args)
 
@@ -101,28 +128,29 @@ def get_git_heads(working_dir, git_user=None, branches=None, branch=None, timeou
     else:
         branches_to_check = ["origin/main", "origin/master"]
 
-    local_result = run_git_command(
-        ["rev-parse", "HEAD"],
+    # One show-ref call resolves HEAD and every candidate remote ref, instead
+    # of a separate rev-parse per ref
+    remote_refs = [f"refs/remotes/{branch_ref}" for branch_ref in branches_to_check]
+    result = run_git_command(
+        ["show-ref", "--head"] + remote_refs,
         cwd=working_dir,
         git_user=git_user,
         timeout=timeout,
     )
-    if local_result.returncode != 0:
+    if result.returncode != 0:
         return None, None
-    local_head = local_result.stdout.strip()
 
-    remote_head = None
-    for branch_ref in branches_to_check:
-        remote_result = run_git_command(
-            ["rev-parse", branch_ref],
-            cwd=working_dir,
-            git_user=git_user,
-            timeout=timeout,
-        )
-        if remote_result.returncode == 0:
-            remote_head = remote_result.stdout.strip()
-            break
+    heads = {}
+    for line in result.stdout.splitlines():
+        sha, _, ref_name = line.strip().partition(" ")
+        if ref_name:
+            heads[ref_name] = sha
+
+    local_head = heads.get("HEAD")
+    if not local_head:
+        return None, None
 
+    remote_head = next((heads[ref] for ref in remote_refs if ref in heads), None)
     return local_head, remote_head
 
 
@@ -197,8 +225,8 @@ class UpdateService(QObject):
         self.git_output = ""
         self.git_process = QProcess()
         self.git_process.setWorkingDirectory(self.working_dir)
+        self.git_process.setProcessChannelMode(QProcess.MergedChannels)
         self.git_process.readyReadStandardOutput.connect(self.on_git_output_ready)
-        self.git_process.readyReadStandardError.connect(self.on_git_output_ready)
         self.git_process.errorOccurred.connect(self.on_git_error)
         self.git_process.finished.connect(self.on_git_finished)
 
@@ -236,15 +264,11 @@ class UpdateService(QObject):
         if self.git_process is None:
             return
 
-        stdout = self.git_process.readAllStandardOutput().data().decode("utf-8", errors="replace")
-        if stdout:
-            self.git_output += stdout
-            self.pull_output.emit(stdout.rstrip("\n"))
-
-        stderr = self.git_process.readAllStandardError().data().decode("utf-8", errors="replace")
-        if stderr:
-            self.git_output += stderr
-            self.pull_output.emit(stderr.rstrip("\n"))
+        # stderr is merged into stdout, so one read drains both streams
+        output = self.git_process.readAllStandardOutput().data().decode("utf-8", errors="replace")
+        if output:
+            self.git_output += output
+            self.pull_output.emit(output.rstrip("\n"))
 
     def on_git_finished(self, exit_code, exit_status):
         self.log(f"on_git_finished: exit_code={exit_code}, exit_status={exit_status}")
@@ -338,7 +362,12 @@ class UpdateServiceRunner:
 
     def fetch(self, timeout=30):
         return run_git_command(
-            ["fetch"],
+            [
+                "-c", f"http.lowSpeedLimit={_FETCH_LOW_SPEED_LIMIT}",
+                "-c", f"http.lowSpeedTime={_FETCH_LOW_SPEED_TIME_S}",
+                "-c", f"core.sshCommand={_FETCH_SSH_COMMAND}",
+                "fetch", "--quiet",
+            ],
             cwd=self.working_dir,
             git_user=None,
             timeout=timeout,
@@ -1,20 +1,28 @@
+import base64
+import binascii
 import hashlib
 import json
 import os
-import re
 import secrets
-from datetime import datetime
+import string
+from datetime import datetime, timezone
 
 from services.file_store import atomic_write_json, file_lock
 
 USERS_FILE = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "users.json"))
 HASH_ITERATIONS = 200_000
-USERNAME_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{2,31}$")
+USERNAME_MIN_LENGTH = 3
+USERNAME_MAX_LENGTH = 32
+USERNAME_FIRST_CHARS = frozenset(string.ascii_letters + string.digits)
+USERNAME_ALLOWED_CHARS = USERNAME_FIRST_CHARS | frozenset("_.-")
 PASSWORD_MIN_LENGTH = 8
+PASSWORD_ALGO = "pbkdf2_sha256_b64"
+LEGACY_PASSWORD_ALGO = "pbkdf2_sha256"
+ISO_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
 
 
 def _now_iso():
-    return datetime.utcnow().isoformat() + "Z"
+    return datetime.now(timezone.utc).strftime(ISO_TIMESTAMP_FORMAT)
 
 
 def _normalize_username(username):
@@ -28,25 +36,35 @@ def _hash_password(password, salt=None, iterations=HASH_ITERATIONS):
         salt = secrets.token_bytes(16)
     digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
     return {
-        "algo": "pbkdf2_sha256",
+        "algo": PASSWORD_ALGO,
         "iterations": iterations,
-        "salt": salt.hex(),
-        "hash": digest.hex(),
+        "salt": base64.b64encode(salt).decode("ascii"),
+        "hash": base64.b64encode(digest).decode("ascii"),
     }
 
 
+def _decode_password_bytes(algo, value):
+    if algo == PASSWORD_ALGO:
+        return base64.b64decode(value, validate=True)
+    return bytes.fromhex(value)
+
+
 def _verify_password(password, password_record):
     if not password_record:
         return False
-    if password_record.get("algo") != "pbkdf2_sha256":
+    algo = password_record.get("algo")
+    if algo not in (PASSWORD_ALGO, LEGACY_PASSWORD_ALGO):
         return False
-    salt_hex = password_record.get("salt", "")
-    hash_hex = password_record.get("hash", "")
+    salt_text = password_record.get("salt", "")
+    hash_text = password_record.get("hash", "")
     iterations = int(password_record.get("iterations", 0) or 0)
-    if not salt_hex or not hash_hex or iterations <= 0:
+    if not salt_text or not hash_text or iterations <= 0:
+        return False
+    try:
+        salt = _decode_password_bytes(algo, salt_text)
+        expected = _decode_password_bytes(algo, hash_text)
+    except (binascii.Error, ValueError):
         return False
-    salt = bytes.fromhex(salt_hex)
-    expected = bytes.fromhex(hash_hex)
     candidate = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
     return secrets.compare_digest(candidate, expected)
 
@@ -54,7 +72,11 @@ def _verify_password(password, password_record):
 def _validate_username(username):
     if not username:
         return False, "Username is required."
-    if not USERNAME_PATTERN.match(username):
+    if (
+        not USERNAME_MIN_LENGTH <= len(username) <= USERNAME_MAX_LENGTH
+        or username[0] not in USERNAME_FIRST_CHARS
+        or not USERNAME_ALLOWED_CHARS.issuperset(username)
+    ):
         return False, "Username must be 3-32 characters (letters, numbers, ., -, _)."
     return True, ""
 
@@ -98,11 +120,12 @@ class UserStore:
 
             username = "admin"
             password = secrets.token_urlsafe(12)
+            now = _now_iso()
             record = {
                 "username": username,
                 "password": _hash_password(password),
-                "created_at": _now_iso(),
-                "updated_at": _now_iso(),
+                "created_at": now,
+                "updated_at": now,
                 "must_change_password": True,
             }
             data["users"] = [record]
@@ -156,11 +179,12 @@ class UserStore:
             for existing in users:
                 if _normalize_username(existing.get("username", "")) == normalized:
                     return False, "Username already exists."
+            now = _now_iso()
             record = {
                 "username": normalized,
                 "password": _hash_password(password),
-                "created_at": _now_iso(),
-                "updated_at": _now_iso(),
+                "created_at": now,
+                "updated_at": now,
                 "must_change_password": False,
             }
             users.append(record)
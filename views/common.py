@@ -3,3 +3,23 @@
 
 def get_font_family(config_store):
     return config_store.get_str('font_family', 'Quicksand')
+
+
+def set_stylesheet_if_changed(widget, stylesheet):
+    """Apply a stylesheet only when it differs, avoiding a needless re-polish."""
+    if widget.styleSheet() != stylesheet:
+        widget.setStyleSheet(stylesheet)
+
+
+def pin_label_width(label, candidate_texts):
+    """Fix a label's width to fit the widest of candidate_texts so later setText calls skip relayout.
+
+    Digits are proportional in most fonts, so pass every text the label can
+    show rather than a single sample.
+    """
+    current_text = label.text()
+    label.ensurePolished()
+    metrics = label.fontMetrics()
+    label.setText(max(candidate_texts, key=metrics.horizontalAdvance))
+    label.setFixedWidth(label.sizeHint().width())
+    label.setText(current_text)
@@ -2,40 +2,54 @@
 
 from PyQt5.QtCore import QEvent, QObject
 from PyQt5.QtGui import QMouseEvent
-from PyQt5.QtWidgets import QAbstractItemView
 
 
 class TouchscreenComboViewFilter(QObject):
-    """Event filter for QComboBox views to handle touchscreen taps correctly."""
+    """Shared event filter for QComboBox views to handle touchscreen taps correctly.
 
-    def __init__(self, combo_box):
-        super().__init__()
-        self.combo_box = combo_box
-        self.pressed_index = None
+    One instance serves every attached combo box; views are mapped back to
+    their combo box so events from unrelated objects pass straight through.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.combo_for_view = {}
+        self.pressed_index = {}
+
+    def attach(self, combo_box):
+        """Install the filter on the combo box's popup view."""
+        view = combo_box.view()
+        if view is None:
+            return
+        if self.combo_for_view.get(view) is not combo_box:
+            self.combo_for_view[view] = combo_box
+            view.installEventFilter(self)
 
     def eventFilter(self, obj, event):
         """Filter events to prevent dropdown from closing on mouse press for touchscreens."""
-        view = self.combo_box.view()
-        if isinstance(obj, QAbstractItemView) and obj == view:
-            if event.type() == QEvent.MouseButtonPress:
-                if isinstance(event, QMouseEvent):
-                    index = obj.indexAt(event.pos())
-                    if index.isValid():
-                        self.pressed_index = index.row()
-                        obj.setCurrentIndex(index)
-                        return True
+        combo_box = self.combo_for_view.get(obj)
+        if combo_box is None:
+            return False
+
+        event_type = event.type()
+        if event_type == QEvent.MouseButtonPress:
+            if isinstance(event, QMouseEvent):
+                index = obj.indexAt(event.pos())
+                if index.isValid():
+                    self.pressed_index[obj] = index.row()
+                    obj.setCurrentIndex(index)
+                    return True
 
-            elif event.type() == QEvent.MouseButtonRelease:
-                if isinstance(event, QMouseEvent):
+        elif event_type == QEvent.MouseButtonRelease:
+            if isinstance(event, QMouseEvent):
+                pressed_index = self.pressed_index.pop(obj, None)
+                if pressed_index is not None:
                     index = obj.indexAt(event.pos())
-                    if self.pressed_index is not None:
-                        if index.isValid():
-                            self.combo_box.setCurrentIndex(index.row())
-                        else:
-                            self.combo_box.setCurrentIndex(self.pressed_index)
-                        self.combo_box.hidePopup()
-                        self.pressed_index = None
-                        return True
-                    self.pressed_index = None
+                    if index.isValid():
+                        combo_box.setCurrentIndex(index.row())
+                    else:
+                        combo_box.setCurrentIndex(pressed_index)
+                    combo_box.hidePopup()
+                    return True
 
         return False
@@ -1,9 +1,47 @@
 """Overlay UI components."""
 
+from functools import lru_cache
+
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
 
-from views.common import get_font_family
+from views.common import get_font_family, pin_label_width
+
+
+@lru_cache(maxsize=8)
+def warning_label_css(font_family):
+    return f"""
+        font-family: {font_family};
+        font-size: 14px;
+        font-weight: bold;
+        color: #721c24;
+        background-color: #f8d7da;
+        padding: 5px 10px;
+        border-radius: 4px;
+    """
+
+
+@lru_cache(maxsize=8)
+def cancel_button_css(font_family):
+    return f"""
+        QPushButton {{
+            font-family: {font_family};
+            font-size: 14px;
+            font-weight: bold;
+            padding: 5px 10px;
+            background-color: #ffffff;
+            color: #721c24;
+            border: 1px solid #f5c6cb;
+            border-radius: 4px;
+        }}
+        QPushButton:hover {{
+            background-color: #f8d7da;
+        }}
+        QPushButton:pressed {{
+            background-color: #f5c6cb;
+            padding-bottom: 4px;
+        }}
+    """
 
 
 class RebootWarningOverlay(QWidget):
@@ -23,13 +61,10 @@ class RebootWarningOverlay(QWidget):
 
         self.setStyleSheet("background-color: rgba(0, 0, 0, 180);")
 
-
-        container_holder = QHBoxLayout()
-        container_holder.addStretch()
-        container_holder.addWidget(self.build_center_container(font_family))
-        container_holder.addStretch()
-        main_layout.addLayout(container_holder)
-        main_layout.addStretch()
+        main_layout.addWidget(
+            self.build_center_container(font_family),
+            alignment=Qt.AlignHCenter | Qt.AlignTop,
+        )
 
         self.setLayout(main_layout)
 
@@ -52,44 +87,19 @@ class RebootWarningOverlay(QWidget):
 
     def build_warning_label(self, font_family):
         warning_label = QLabel("Rebooting in 60 seconds")
-        warning_label.setStyleSheet(
-            f"""
-            font-family: {font_family};
-            font-size: 14px;
-            font-weight: bold;
-            color: #721c24;
-            background-color: #f8d7da;
-            padding: 5px 10px;
-            border-radius: 4px;
-        """
-        )
+        warning_label.setTextFormat(Qt.PlainText)
+        warning_label.setStyleSheet(warning_label_css(font_family))
         warning_label.setAlignment(Qt.AlignCenter)
         warning_label.setWordWrap(False)
+        pin_label_width(
+            warning_label,
+            [f"Rebooting in {seconds} seconds" for seconds in range(61)],
+        )
         return warning_label
 
     def build_cancel_button(self, font_family):
         cancel_button = QPushButton("Cancel Reboot")
-        cancel_button.setStyleSheet(
-            f"""
-            QPushButton {{
-                font-family: {font_family};
-                font-size: 14px;
-                font-weight: bold;
-                padding: 5px 10px;
-                background-color: #ffffff;
-                color: #721c24;
-                border: 1px solid #f5c6cb;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: #f8d7da;
-            }}
-            QPushButton:pressed {{
-                background-color: #f5c6cb;
-                padding-bottom: 4px;
-            }}
-        """
-        )
+        cancel_button.setStyleSheet(cancel_button_css(font_family))
         return cancel_button
 
     def update_countdown(self, seconds):
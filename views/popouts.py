@@ -1,6 +1,10 @@
 """Popout UI components."""
 
-from PyQt5.QtCore import Qt
+from functools import lru_cache
+from html import escape
+
+from PyQt5.QtCore import QRectF, Qt, QTimer
+from PyQt5.QtGui import QPainterPath, QRegion
 from PyQt5.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -10,7 +14,109 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
-from views.common import get_font_family
+from views.common import get_font_family, set_stylesheet_if_changed
+
+
+OUTPUT_FLUSH_INTERVAL_MS = 50
+OUTPUT_MAX_BLOCKS = 1000
+
+OUTPUT_TEXT_CSS = """
+    QPlainTextEdit {
+        font-family: Consolas, Monaco, monospace;
+        font-size: 12px;
+        background-color: #1e1e1e;
+        color: #d4d4d4;
+        border: none;
+        padding: 10px;
+    }
+"""
+
+
+@lru_cache(maxsize=8)
+def info_text_css(font_family):
+    return f"font-family: {font_family}; font-size: 16px; border: none;"
+
+
+def info_row_html(label_text, value_text):
+    return (
+        f'<span style="font-weight: bold; color: #333;">{escape(label_text)}</span>'
+        f'&nbsp;&nbsp;<span style="color: #666;">{escape(value_text)}</span>'
+    )
+
+
+@lru_cache(maxsize=8)
+def header_label_css(font_family):
+    return f"font-family: {font_family}; font-size: 14px; font-weight: bold; color: #333; border: none;"
+
+
+@lru_cache(maxsize=8)
+def close_button_css(font_family):
+    return f"""
+        QPushButton {{
+            font-family: {font_family};
+            font-size: 16px;
+            font-weight: bold;
+            padding: 0px;
+            background-color: transparent;
+            border: none;
+            color: #666;
+        }}
+        QPushButton:hover {{
+            color: #000;
+            background-color: #e0e0e0;
+            border-radius: 3px;
+        }}
+        QPushButton:pressed {{
+            background-color: #d0d0d0;
+        }}
+    """
+
+
+@lru_cache(maxsize=8)
+def success_label_css(font_family):
+    return f"""
+        QLabel {{
+            font-family: {font_family};
+            font-size: 13px;
+            font-weight: bold;
+            color: #2a7a2a;
+            background-color: #e8f5e9;
+            border: none;
+            padding: 8px 10px;
+        }}
+    """
+
+
+@lru_cache(maxsize=8)
+def action_button_css(font_family):
+    return f"""
+        QPushButton {{
+            font-family: {font_family};
+            font-size: 18px;
+            font-weight: bold;
+            padding: 10px 20px;
+            background-color: #e0e0e0;
+            border: none;
+            border-radius: 5px;
+        }}
+        QPushButton:hover {{
+            background-color: #d0d0d0;
+        }}
+        QPushButton:pressed {{
+            background-color: #c0c0c0;
+            padding-bottom: 9px;
+        }}
+        QPushButton[confirm="true"] {{
+            background-color: #f44336;
+            color: white;
+        }}
+        QPushButton[confirm="true"]:hover {{
+            background-color: #da190b;
+        }}
+        QPushButton[confirm="true"]:pressed {{
+            background-color: #c1170a;
+        }}
+    """
 
 
 class IPPopout(QWidget):
@@ -23,54 +129,47 @@ class IPPopout(QWidget):
         font_family = get_font_family(self.config_store)
 
         self.setWindowFlags(Qt.ToolTip | Qt.FramelessWindowHint)
-        self.setAttribute(Qt.WA_TranslucentBackground, True)
 
         content_layout = QVBoxLayout()
         content_layout.setContentsMargins(15, 10, 15, 10)
-        content_layout.setSpacing(8)
 
-        content_layout.addLayout(
-            self.build_info_row("Device IP:", ip_address, font_family)
-        )
-        content_layout.addLayout(
-            self.build_info_row("Tailscale Address:", tailscale_address, font_family)
+        content_layout.addWidget(
+            self.build_info_label(ip_address, tailscale_address, font_family)
         )
 
-        container = QWidget()
-        container.setLayout(content_layout)
-        container.setStyleSheet(
+        # Style the popout itself rather than an inner container widget
+        self.setObjectName("ipPopout")
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        self.setStyleSheet(
             """
-            QWidget {
+            QWidget#ipPopout {
                 background-color: white;
                 border: 2px solid white;
                 border-radius: 10px;
             }
         """
         )
-
-        main_layout = QVBoxLayout()
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.addWidget(container)
-        self.setLayout(main_layout)
+        self.setLayout(content_layout)
 
         self.adjustSize()
 
-    def build_info_row(self, label_text, value_text, font_family):
-        row = QHBoxLayout()
-        row.setSpacing(10)
-
-        label = QLabel(label_text)
-        label.setStyleSheet(
-            f"font-family: {font_family}; font-size: 16px; font-weight: bold; color: #333; border: none;"
+    def resizeEvent(self, event):
+        """Clip the opaque popout to its rounded frame instead of alpha blending."""
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(self.rect()), 10, 10)
+        self.setMask(QRegion(path.toFillPolygon().toPolygon()))
+        super().resizeEvent(event)
+
+    def build_info_label(self, ip_address, tailscale_address, font_family):
+        # One rich-text label replaces a label pair per row; values are escaped
+        info_label = QLabel(
+            info_row_html("Device IP:", ip_address)
+            + "<br>"
+            + info_row_html("Tailscale Address:", tailscale_address)
         )
-        row.addWidget(label)
-
-        value = QLabel(value_text)
-        value.setStyleSheet(
-            f"font-family: {font_family}; font-size: 16px; color: #666; border: none;"
-        )
-        row.addWidget(value)
-        return row
+        info_label.setTextFormat(Qt.RichText)
+        info_label.setStyleSheet(info_text_css(font_family))
+        return info_label
 
 
 class UpdatePopout(QWidget):
@@ -80,10 +179,18 @@ class UpdatePopout(QWidget):
         super().__init__(parent)
 
         self.config_store = config_store
-        font_family = get_font_family(self.config_store)
+        self.font_family = get_font_family(self.config_store)
+        self.config_store.subscribe(self.on_config_changed)
+        font_family = self.font_family
 
         self.setWindowFlags(Qt.ToolTip | Qt.FramelessWindowHint)
-        self.setAttribute(Qt.WA_TranslucentBackground, False)
+
+        # Output lines are buffered and written in batches to limit repaints
+        self.pending_output = []
+        self.output_flush_timer = QTimer(self)
+        self.output_flush_timer.setSingleShot(True)
+        self.output_flush_timer.setInterval(OUTPUT_FLUSH_INTERVAL_MS)
+        self.output_flush_timer.timeout.connect(self.flush_output)
 
         content_layout = QVBoxLayout()
         content_layout.setContentsMargins(3, 3, 3, 3)
@@ -93,53 +200,24 @@ class UpdatePopout(QWidget):
         content_layout.addWidget(self.build_output_text())
         content_layout.addWidget(self.build_success_label(font_family))
 
-        container = self.wrap_container(content_layout)
-
-        main_layout = QVBoxLayout()
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.addWidget(container)
-        self.setLayout(main_layout)
+        self.apply_frame_style()
+        self.setLayout(content_layout)
 
         self.setFixedSize(500, 300)
 
+    def on_config_changed(self, config, changed_keys):
+        """Track font changes so clear_output does not re-read the config."""
+        if "font_family" in changed_keys:
+            self.font_family = get_font_family(self.config_store)
+
     def header_label_stylesheet(self, font_family):
-        return (
-            f"font-family: {font_family}; font-size: 14px; font-weight: bold; color: #333; border: none;"
-        )
+        return header_label_css(font_family)
 
     def close_button_stylesheet(self, font_family):
-        return f"""
-            QPushButton {{
-                font-family: {font_family};
-                font-size: 16px;
-                font-weight: bold;
-                padding: 0px;
-                background-color: transparent;
-                border: none;
-                color: #666;
-            }}
-            QPushButton:hover {{
-                color: #000;
-                background-color: #e0e0e0;
-                border-radius: 3px;
-            }}
-            QPushButton:pressed {{
-                background-color: #d0d0d0;
-            }}
-        """
+        return close_button_css(font_family)
 
     def success_label_stylesheet(self, font_family):
-        return f"""
-            QLabel {{
-                font-family: {font_family};
-                font-size: 13px;
-                font-weight: bold;
-                color: #2a7a2a;
-                background-color: #e8f5e9;
-                border: none;
-                padding: 8px 10px;
-            }}
-        """
+        return success_label_css(font_family)
 
     def build_header(self, font_family):
         header = QWidget()
@@ -151,6 +229,7 @@ class UpdatePopout(QWidget):
         header_layout.setContentsMargins(10, 5, 5, 5)
 
         self.header_label = QLabel("Update Status")
+        self.header_label.setTextFormat(Qt.PlainText)
         self.header_label.setStyleSheet(self.header_label_stylesheet(font_family))
         header_layout.addWidget(self.header_label)
         header_layout.addStretch()
@@ -166,56 +245,58 @@ class UpdatePopout(QWidget):
     def build_output_text(self):
         self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
-        self.output_text.setStyleSheet(
-            """
-            QPlainTextEdit {
-                font-family: Consolas, Monaco, monospace;
-                font-size: 12px;
-                background-color: #1e1e1e;
-                color: #d4d4d4;
-                border: none;
-                padding: 10px;
-            }
-        """
-        )
+        # Cap retained lines and skip undo history for the read-only log view
+        self.output_text.setMaximumBlockCount(OUTPUT_MAX_BLOCKS)
+        self.output_text.setUndoRedoEnabled(False)
+        self.output_scrollbar = self.output_text.verticalScrollBar()
+        self.output_text.setStyleSheet(OUTPUT_TEXT_CSS)
         return self.output_text
 
     def build_success_label(self, font_family):
         self.success_label = QLabel()
+        self.success_label.setTextFormat(Qt.PlainText)
         self.success_label.setStyleSheet(self.success_label_stylesheet(font_family))
         self.success_label.setWordWrap(True)
         self.success_label.hide()
         return self.success_label
 
-    def wrap_container(self, content_layout):
-        container = QWidget()
-        container.setLayout(content_layout)
-        container.setStyleSheet(
+    def apply_frame_style(self):
+        self.setObjectName("updatePopout")
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        self.setStyleSheet(
             """
-            QWidget {
+            QWidget#updatePopout {
                 background-color: white;
                 border: 3px solid #666;
                 border-radius: 5px;
             }
         """
         )
-        return container
 
     def append_output(self, text):
-        """Append text to the output area."""
-        self.output_text.appendPlainText(text)
-        self.output_text.verticalScrollBar().setValue(
-            self.output_text.verticalScrollBar().maximum()
-        )
+        """Queue text for the output area; queued text is flushed in one batch."""
+        self.pending_output.append(text)
+        if not self.output_flush_timer.isActive():
+            self.output_flush_timer.start()
+
+    def flush_output(self):
+        """Write queued output to the output area and scroll to the bottom."""
+        if not self.pending_output:
+            return
+        self.output_text.appendPlainText("\n".join(self.pending_output))
+        self.pending_output.clear()
+        self.output_scrollbar.setValue(self.output_scrollbar.maximum())
 
     def clear_output(self):
         """Clear the output area and hide success label."""
-        font_family = get_font_family(self.config_store)
+        font_family = self.font_family
 
-        self.header_label.setStyleSheet(self.header_label_stylesheet(font_family))
-        self.close_button.setStyleSheet(self.close_button_stylesheet(font_family))
-        self.success_label.setStyleSheet(self.success_label_stylesheet(font_family))
+        set_stylesheet_if_changed(self.header_label, self.header_label_stylesheet(font_family))
+        set_stylesheet_if_changed(self.close_button, self.close_button_stylesheet(font_family))
+        set_stylesheet_if_changed(self.success_label, self.success_label_stylesheet(font_family))
 
+        self.output_flush_timer.stop()
+        self.pending_output.clear()
         self.output_text.clear()
         self.success_label.hide()
 
@@ -233,9 +314,9 @@ class ShutdownPopout(QWidget):
 
         self.config_store = config_store
         self.font_family = get_font_family(self.config_store)
+        self.config_store.subscribe(self.on_config_changed)
 
         self.setWindowFlags(Qt.ToolTip | Qt.FramelessWindowHint)
-        self.setAttribute(Qt.WA_TranslucentBackground, False)
 
         self.shutdown_confirmed = False
         self.reboot_confirmed = False
@@ -264,100 +345,50 @@ class ShutdownPopout(QWidget):
 
         self.adjustSize()
 
-    def default_action_button_stylesheet(self):
-        return f"""
-            QPushButton {{
-                font-family: {self.font_family};
-                font-size: 18px;
-                font-weight: bold;
-                padding: 10px 20px;
-                background-color: #e0e0e0;
-                border: none;
-                border-radius: 5px;
-            }}
-            QPushButton:hover {{
-                background-color: #d0d0d0;
-            }}
-            QPushButton:pressed {{
-                background-color: #c0c0c0;
-                padding-bottom: 9px;
-            }}
-        """
+    def on_config_changed(self, config, changed_keys):
+        """Track font changes so the reset handlers do not re-read the config."""
+        if "font_family" in changed_keys:
+            self.font_family = get_font_family(self.config_store)
+
+    def action_button_stylesheet(self):
+        return action_button_css(self.font_family)
 
     def build_default_action_button(self, label):
         button = QPushButton(label)
         button.setMinimumWidth(200)
-        button.setStyleSheet(self.default_action_button_stylesheet())
+        button.setProperty("confirm", False)
+        button.setStyleSheet(self.action_button_stylesheet())
         return button
 
+    def apply_button_state(self, button, text, confirm):
+        """Set a power button's label and toggle its confirm style.
+
+        Both states live in one stylesheet, so switching only re-polishes
+        the button instead of parsing a new stylesheet.
+        """
+        button.setText(text)
+        set_stylesheet_if_changed(button, self.action_button_stylesheet())
+        if button.property("confirm") != confirm:
+            button.setProperty("confirm", confirm)
+            button.style().unpolish(button)
+            button.style().polish(button)
+
     def reset_shutdown_state(self):
         """Reset the shutdown button to its initial state."""
-        self.font_family = get_font_family(self.config_store)
-
         self.shutdown_confirmed = False
-        self.shutdown_button.setText("Shutdown")
-        self.shutdown_button.setMinimumWidth(200)
-        self.shutdown_button.setStyleSheet(self.default_action_button_stylesheet())
+        self.apply_button_state(self.shutdown_button, "Shutdown", False)
 
     def reset_reboot_state(self):
         """Reset the reboot button to its initial state."""
-        self.font_family = get_font_family(self.config_store)
-
         self.reboot_confirmed = False
-        self.reboot_button.setText("Reboot")
-        self.reboot_button.setMinimumWidth(200)
-        self.reboot_button.setStyleSheet(self.default_action_button_stylesheet())
+        self.apply_button_state(self.reboot_button, "Reboot", False)
 
     def set_reboot_confirm_state(self):
         """Set the reboot button to confirmation state (red)."""
         self.reboot_confirmed = True
-        self.reboot_button.setText("Confirm Reboot")
-        self.reboot_button.setMinimumWidth(200)
-        self.reboot_button.setStyleSheet(
-            f"""
-            QPushButton {{
-                font-family: {self.font_family};
-                font-size: 18px;
-                font-weight: bold;
-                padding: 10px 20px;
-                background-color: #f44336;
-                color: white;
-                border: none;
-                border-radius: 5px;
-            }}
-            QPushButton:hover {{
-                background-color: #da190b;
-            }}
-            QPushButton:pressed {{
-                background-color: #c1170a;
-                padding-bottom: 9px;
-            }}
-        """
-        )
+        self.apply_button_state(self.reboot_button, "Confirm Reboot", True)
 
     def set_shutdown_confirm_state(self):
         """Set the shutdown button to confirmation state (red)."""
         self.shutdown_confirmed = True
-        self.shutdown_button.setText("Confirm Shutdown")
-        self.shutdown_button.setMinimumWidth(200)
-        self.shutdown_button.setStyleSheet(
-            f"""
-            QPushButton {{
-                font-family: {self.font_family};
-                font-size: 18px;
-                font-weight: bold;
-                padding: 10px 20px;
-                background-color: #f44336;
-                color: white;
-                border: none;
-                border-radius: 5px;
-            }}
-            QPushButton:hover {{
-                background-color: #da190b;
-            }}
-            QPushButton:pressed {{
-                background-color: #c1170a;
-                padding-bottom: 9px;
-            }}
-        """
-        )
+        self.apply_button_state(self.shutdown_button, "Confirm Shutdown", True)
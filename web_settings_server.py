@@ -1,21 +1,33 @@
 import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask, request, jsonify, render_template, redirect, url_for, Response, session
 from subprocess import PIPE, STDOUT
 from services.background_jobs import background_jobs
-from services.config_store import ConfigStore
+from services.config_store import ConfigStore, parse_reboot_time
 from services.message_store import MessageStore
 from services.user_store import UserStore
 from services.system_service import SystemService
 from services.update_service import UpdateServiceRunner, build_git_command, has_git_error, has_updates
 from services.system_actions import run_command, start_process
 import os
+import re
 import secrets
+import shutil
 from datetime import datetime, timedelta
 import sys
 import time
 import json
 import traceback
 
+# Directory containing this module; the git checkout and sibling scripts live here
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Input validation patterns used by the SSH key and git endpoints
+_EMAIL_RE = re.compile(r'^[\w.+-]+@[\w.-]+\.[a-zA-Z]{2,}$')
+_GITHUB_HTTPS_RE = re.compile(r'https://github\.com/([^/]+)/(.+?)(?:\.git)?$')
+_BRANCH_NAME_RE = re.compile(r'^[\w./-]+$')
+
 # Debug logging for git operations
 _GIT_DEBUG = True
 
@@ -30,7 +42,141 @@ def _git_debug_log(message, include_stack=False):
             traceback.print_stack()
 
 
-_data_lock = threading.Lock()
+# Striped locks for data_handler cache reads. A miss fetches from the Metro
+# API while holding the lock, so spreading keys over several locks keeps one
+# slow fetch from stalling reads of other lines/stations. The stripe count is
+# fixed so arbitrary codes in query strings cannot grow the lock table.
+# Callers never hold two data locks at once, so shared stripes cannot deadlock.
+_DATA_LOCK_STRIPES = 16
+_data_locks = tuple(threading.Lock() for _ in range(_DATA_LOCK_STRIPES))
+
+
+def _data_lock(key):
+    return _data_locks[hash(key) % _DATA_LOCK_STRIPES]
+
+# How long status values shown on the web pages stay fresh before a refresh
+_NETWORK_STATUS_TTL_S = 30
+_GIT_STATUS_TTL_S = 5
+
+# Delay before reboot/shutdown so the JSON response reaches the browser
+_POWER_ACTION_DELAY_S = 0.25
+
+# Runs the index page's status probes concurrently
+_status_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="status-probe")
+
+
+class _TimedValue:
+    """
+    Cache a slow lookup (usually a subprocess) for a fixed number of seconds.
+    The first call computes the value inline. Once it is older than the TTL,
+    callers get the stale value while one background thread refreshes it, so
+    page handlers do not wait on the subprocess again. Nothing refreshes it
+    while idle, so a value older than twice the TTL is recomputed inline
+    rather than served. invalidate() forces the next call to recompute.
+    """
+
+    def __init__(self, compute, ttl_s):
+        self._compute = compute
+        self._ttl_s = ttl_s
+        self._max_age_s = 2 * ttl_s
+        self._lock = threading.Lock()
+        self._value = None
+        self._computed_at = None
+        self._generation = 0
+        self._refreshing = False
+
+    def get(self):
+        with self._lock:
+            generation = self._generation
+            if self._computed_at is None:
+                inline = True
+            else:
+                age = time.monotonic() - self._computed_at
+                if age >= self._max_age_s:
+                    inline = True
+                elif self._refreshing or age < self._ttl_s:
+                    return self._value
+                else:
+                    inline = False
+                    self._refreshing = True
+                    stale_value = self._value
+
+        if inline:
+            return self._refresh(generation)
+        threading.Thread(target=self._refresh, args=(generation, True), daemon=True).start()
+        return stale_value
+
+    def invalidate(self):
+        """Drop the cached value; a refresh already running will not store its result."""
+        with self._lock:
+            self._generation += 1
+            self._value = None
+            self._computed_at = None
+
+    def _refresh(self, generation, background=False):
+        try:
+            value = self._compute()
+            with self._lock:
+                if generation == self._generation:
+                    self._value = value
+                    self._computed_at = time.monotonic()
+            return value
+        finally:
+            if background:
+                with self._lock:
+                    self._refreshing = False
+
+
+# Formatted "last saved" strings keyed by path, reused while the mtime is unchanged
+_last_saved_cache = {}
+
+
+def _format_last_saved(path):
+    """Return a file's modification time for display, or "Never" if it does not exist."""
+    try:
+        mtime = os.stat(path).st_mtime
+    except FileNotFoundError:
+        return "Never"
+    cached = _last_saved_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    formatted = datetime.fromtimestamp(mtime).strftime("%m/%d/%Y %I:%M:%S %p")
+    _last_saved_cache[path] = (mtime, formatted)
+    return formatted
+
+
+class _HttpsRedirectHandler(BaseHTTPRequestHandler):
+    """Answer every plain-HTTP request with a 301 to the same URL over HTTPS."""
+
+    def redirect_to_https(self):
+        host = self.headers.get("Host") or self.server.server_address[0]
+        self.send_response(301)
+        self.send_header("Location", f"https://{host}{self.path}")
+        self.send_header("Content-Length", "0")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+    do_GET = do_HEAD = do_POST = do_PUT = do_DELETE = do_PATCH = do_OPTIONS = redirect_to_https
+
+
+def _conditional_json(payload):
+    """Return a JSON response tagged with an ETag, or 304 if the client has it.
+
+    ``no-cache`` keeps clients revalidating, since these payloads change when
+    settings are saved or predictions refresh; an unchanged body costs only
+    an empty 304.
+    """
+    response = jsonify(payload)
+    response.cache_control.no_cache = True
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+def _schedule_power_action(action):
+    """Run a reboot/shutdown shortly after the HTTP response has been sent."""
+    timer = threading.Timer(_POWER_ACTION_DELAY_S, action)
+    timer.daemon = True
+    timer.start()
 
 
 def _get_boot_id():
@@ -108,23 +254,43 @@ _SSL_CERT_DIR = os.path.expanduser("~/https")
 _ssl_enabled = False
 
 
+# Last scan of _SSL_CERT_DIR, keyed on the directory's mtime
+_ssl_paths_cache = {"mtime_ns": None, "paths": (None, None)}
+
+
 def _get_ssl_cert_paths():
     """
     Auto-detect SSL certificate and key files in ~/https directory.
     Returns tuple of (cert_path, key_path) or (None, None) if not found.
+    The directory is only rescanned when its mtime changes (a file was
+    added, removed or renamed).
     """
+    try:
+        mtime_ns = os.stat(_SSL_CERT_DIR).st_mtime_ns
+    except OSError:
+        return None, None
+
+    if _ssl_paths_cache["mtime_ns"] == mtime_ns:
+        return _ssl_paths_cache["paths"]
+
     cert_path = None
     key_path = None
-    
-    if os.path.isdir(_SSL_CERT_DIR):
-        for filename in os.listdir(_SSL_CERT_DIR):
-            filepath = os.path.join(_SSL_CERT_DIR, filename)
-            if os.path.isfile(filepath):
-                if filename.endswith('.crt') and cert_path is None:
-                    cert_path = filepath
-                elif filename.endswith('.key') and key_path is None:
-                    key_path = filepath
-    
+    try:
+        with os.scandir(_SSL_CERT_DIR) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if entry.name.endswith('.crt') and cert_path is None:
+                    cert_path = entry.path
+                elif entry.name.endswith('.key') and key_path is None:
+                    key_path = entry.path
+                if cert_path and key_path:
+                    break
+    except OSError:
+        return None, None
+
+    _ssl_paths_cache["mtime_ns"] = mtime_ns
+    _ssl_paths_cache["paths"] = (cert_path, key_path)
     return cert_path, key_path
 
 
@@ -174,28 +340,52 @@ def _ensure_lines(data_handler):
     return lines
 
 
+def _column_values(df, column, default=None):
+    """Return a DataFrame column as a plain list, or defaults if the column is missing."""
+    if column in df.columns:
+        return df[column].tolist()
+    return [default] * len(df)
+
+
+# Built lists keyed by code, paired with the DataFrame they came from. The
+# data handler swaps in a new DataFrame on every fetch, so an identity check
+# is enough to tell when an entry is stale.
+_stations_result_cache = {}
+_directions_result_cache = {}
+
+
 def _get_stations_for_line(data_handler, line_code):
     if not line_code:
         return []
-    with _data_lock:
+    with _data_lock(("stations", line_code)):
         stations_df = data_handler.get_cached_stations(line_code)
     if stations_df is None or stations_df.empty:
         return []
-    return [{"name": row.get("Name", ""), "code": row.get("Code", "")} for _, row in stations_df.iterrows()]
+    cached = _stations_result_cache.get(line_code)
+    if cached is not None and cached[0] is stations_df:
+        return cached[1]
+    names = _column_values(stations_df, "Name", "")
+    codes = _column_values(stations_df, "Code", "")
+    stations = [{"name": name, "code": code} for name, code in zip(names, codes)]
+    _stations_result_cache[line_code] = (stations_df, stations)
+    return stations
 
 
 def _get_directions_for_station(data_handler, station_code):
     if not station_code:
         return []
-    with _data_lock:
+    with _data_lock(("predictions", station_code)):
         predictions_df = data_handler.get_cached_predictions(station_code)
     if predictions_df is None or predictions_df.empty:
         return []
+    cached = _directions_result_cache.get(station_code)
+    if cached is not None and cached[0] is predictions_df:
+        return cached[1]
     # Group by destination, collect unique line codes
     by_destination = {}
-    for _, row in predictions_df.iterrows():
-        dest = row.get("DestinationName")
-        line_code = row.get("Line")
+    destinations = _column_values(predictions_df, "DestinationName")
+    line_codes = _column_values(predictions_df, "Line")
+    for dest, line_code in zip(destinations, line_codes):
         if not dest:
             continue
         line_set = by_destination.setdefault(dest, set())
@@ -207,11 +397,20 @@ def _get_directions_for_station(data_handler, station_code):
         for name, lines in by_destination.items()
     ]
     results.sort(key=lambda d: d["name"])  # sort alphabetically by destination name
+    _directions_result_cache[station_code] = (predictions_df, results)
     return results
 
 
+# Timezone list from timedatectl; it does not change while the server runs
+_timezones_cache = None
+
+
 def _get_available_timezones():
     """Get list of available timezones from timedatectl, filtered to canonical names only."""
+    global _timezones_cache
+    if _timezones_cache is not None:
+        return _timezones_cache
+
     # Only include canonical timezone prefixes (excludes legacy names like US/Central, EST, etc.)
     canonical_prefixes = (
         "Africa/", "America/", "Antarctica/", "Arctic/", "Asia/",
@@ -225,10 +424,11 @@ def _get_available_timezones():
             log_label="timezones_list",
         )
         if result.ok:
-            timezones = [tz.strip() for tz in result.stdout.splitlines() if tz.strip()]
+            timezones = [tz for tz in map(str.strip, result.stdout.splitlines()) if tz]
             # Filter to canonical timezones + UTC
             filtered = [tz for tz in timezones if tz.startswith(canonical_prefixes) or tz == "UTC"]
-            return filtered if filtered else timezones  # Fall back to full list if filter is empty
+            _timezones_cache = filtered if filtered else timezones  # Fall back to full list if filter is empty
+            return _timezones_cache
     except Exception:
         pass
     # Fallback to common timezones if timedatectl fails (e.g., on Windows dev machine)
@@ -239,8 +439,24 @@ def _get_available_timezones():
     ]
 
 
+# Shown as selected on the settings page when the system zone cannot be detected
+_FALLBACK_TIMEZONE = "America/Chicago"
+
+
 def _get_current_system_timezone():
-    """Get the current system timezone from timedatectl."""
+    """Get the current system timezone, from the /etc/localtime link or timedatectl.
+
+    Returns None if it cannot be determined.
+    """
+    # systemd keeps /etc/localtime as a symlink into the zoneinfo tree, so a
+    # readlink answers without spawning timedatectl on every settings render
+    try:
+        target = os.readlink("/etc/localtime")
+    except OSError:
+        target = ""
+    _, marker, zone_name = target.partition("zoneinfo/")
+    if marker and zone_name:
+        return zone_name
     try:
         result = run_command(
             ["timedatectl", "show", "--property=Timezone", "--value"],
@@ -251,7 +467,7 @@ def _get_current_system_timezone():
             return result.stdout.strip()
     except Exception:
         pass
-    return "America/Chicago"  # Fallback default
+    return None
 
 
 def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
@@ -263,7 +479,7 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
     system_service = SystemService()
     git_user = get_current_user()
     update_service = UpdateServiceRunner(
-        working_dir=os.path.dirname(os.path.abspath(__file__)),
+        working_dir=_APP_DIR,
         git_user=git_user,
     )
     
@@ -357,22 +573,20 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
         return None
 
     def _get_config_last_saved():
-        config_path = config_store.path
-        if os.path.exists(config_path):
-            mtime = os.path.getmtime(config_path)
-            dt = datetime.fromtimestamp(mtime)
-            return dt.strftime("%m/%d/%Y %I:%M:%S %p")
-        return "Never"
+        return _format_last_saved(config_store.path)
 
     def _get_device_ip():
-        return system_service.get_device_ip()
+        return device_ip_cache.get()
 
     def _get_tailscale_address():
-        return system_service.get_tailscale_address()
+        return tailscale_address_cache.get()
 
     def _get_commit_version():
+        return commit_version_cache.get()
+
+    def _read_commit_version():
         """Get the latest git commit version info (short hash, message, author date)."""
-        cwd = os.path.dirname(os.path.abspath(__file__))
+        cwd = _APP_DIR
         try:
             result = run_command(
                 ["git", "log", "-1", "--format=%h - %s (%ad)", "--date=format:%b %d, %Y %I:%M %p"],
@@ -396,7 +610,7 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
 
         if reboot_enabled:
             try:
-                reboot_time = datetime.strptime(reboot_time_str, "%I:%M %p").time()
+                reboot_time = parse_reboot_time(reboot_time_str)
                 target_dt = datetime.combine(now.date(), reboot_time)
                 if target_dt <= now:
                     target_dt += timedelta(days=1)
@@ -415,15 +629,7 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
 
     def _check_tailscale_installed():
         """Check if tailscale is installed on the system."""
-        try:
-            result = run_command(
-                ["which", "tailscale"],
-                timeout_s=5,
-                log_label="tailscale_check",
-            )
-            return result.ok
-        except Exception:
-            return False
+        return shutil.which("tailscale") is not None
 
     def _get_ssl_status():
         """Get SSL certificate status including tailscale info."""
@@ -446,12 +652,7 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
         }
 
     def _get_messages_last_saved():
-        messages_path = message_store.path
-        if os.path.exists(messages_path):
-            mtime = os.path.getmtime(messages_path)
-            dt = datetime.fromtimestamp(mtime)
-            return dt.strftime("%m/%d/%Y %I:%M:%S %p")
-        return "Never"
+        return _format_last_saved(message_store.path)
 
     def _get_display_name():
         """Get the display name (title_text) from config for page titles."""
@@ -464,6 +665,9 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
         Does NOT run git fetch - relies on fetch having been run recently (by the display app).
         Uses the configured git_branch setting to determine which branch to check.
         """
+        return update_available_cache.get()
+
+    def _read_update_available():
         try:
             configured_branch = config_store.get_str("git_branch", "main")
             local_head, remote_head = update_service.get_heads(timeout=5, branch=configured_branch)
@@ -473,6 +677,18 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
         except Exception:
             return False
 
+    # Status shown on the index/update pages comes from subprocesses; cache it
+    # so page loads do not block on tailscale/git every time.
+    device_ip_cache = _TimedValue(system_service.get_device_ip, _NETWORK_STATUS_TTL_S)
+    tailscale_address_cache = _TimedValue(system_service.get_tailscale_address, _NETWORK_STATUS_TTL_S)
+    commit_version_cache = _TimedValue(_read_commit_version, _GIT_STATUS_TTL_S)
+    update_available_cache = _TimedValue(_read_update_available, _GIT_STATUS_TTL_S)
+
+    def _invalidate_git_status():
+        """Forget cached git status after the checkout changed (pull or branch switch)."""
+        commit_version_cache.invalidate()
+        update_available_cache.invalidate()
+
     @app.get("/login")
     def login():
         return render_template(
@@ -606,17 +822,19 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
         config = config_store.load()
         
         # Always get timezone from system, not config
-        current_timezone = _get_current_system_timezone()
+        current_timezone = _get_current_system_timezone() or _FALLBACK_TIMEZONE
         
-        with _data_lock:
+        with _data_lock("lines"):
             lines_df = _ensure_lines(data_handler)
         lines = []
         if lines_df is not None and not lines_df.empty:
-            for _, line in lines_df.iterrows():
-                lines.append({
-                    "line_code": line.get("LineCode", ""),
-                    "display_name": line.get("DisplayName", "")
-                })
+            lines = [
+                {"line_code": line_code, "display_name": display_name}
+                for line_code, display_name in zip(
+                    _column_values(lines_df, "LineCode", ""),
+                    _column_values(lines_df, "DisplayName", ""),
+                )
+            ]
 
         selected_line = config.get("selected_line")
         stations = _get_stations_for_line(data_handler, selected_line)
@@ -637,14 +855,19 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
 
     @app.get("/")
     def index():
+        # The probes are independent; on a cold cache run them side by side
+        device_ip = _status_pool.submit(_get_device_ip)
+        tailscale_address = _status_pool.submit(_get_tailscale_address)
+        commit_version = _status_pool.submit(_get_commit_version)
+        update_available = _status_pool.submit(check_for_updates)
         return render_template(
             "index.html",
-            device_ip=_get_device_ip(),
-            tailscale_address=_get_tailscale_address(),
-            commit_version=_get_commit_version(),
+            device_ip=device_ip.result(),
+            tailscale_address=tailscale_address.result(),
+            commit_version=commit_version.result(),
             ssl_enabled=_ssl_enabled,
             display_name=_get_display_name(),
-            update_available=check_for_updates()
+            update_available=update_available.result()
         )
 
     @app.get("/update")
@@ -665,17 +888,7 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
     @app.get("/api-key")
     def get_api_key():
         # Check SSH key status for initial page render
-        home = os.path.expanduser("~")
-        ssh_private = os.path.join(home, ".ssh", "id_ed25519")
-        ssh_public = os.path.join(home, ".ssh", "id_ed25519.pub")
-        ssh_key_exists = os.path.exists(ssh_private) and os.path.exists(ssh_public)
-        ssh_public_key = ""
-        if ssh_key_exists:
-            try:
-                with open(ssh_public, "r") as f:
-                    ssh_public_key = f.read().strip()
-            except Exception:
-                pass
+        ssh_key_exists, ssh_public_key = _check_ssh_keys_exist()
         # Get git remote type for initial page render
         git_remote_info = _get_git_remote_info()
         git_remote_type = git_remote_info["type"]
@@ -706,9 +919,25 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
         public_key = os.path.join(ssh_dir, "id_ed25519.pub")
         return ssh_dir, private_key, public_key
 
+    def _finish_interrupted_key_swap(private_key, public_key):
+        """Complete a key swap that stopped between its two os.replace calls.
+
+        _generate_ssh_key moves the new private key into place first, so a
+        leftover new public key without its private key means the pair on
+        disk is mismatched; moving the public key in restores the new pair.
+        """
+        new_private_key = f"{private_key}.new"
+        new_public_key = f"{new_private_key}.pub"
+        if os.path.exists(new_public_key) and not os.path.exists(new_private_key):
+            os.replace(new_public_key, public_key)
+
     def _check_ssh_keys_exist():
         """Check if SSH keys exist and return public key content if they do."""
         _, private_key, public_key = _get_ssh_key_paths()
+        try:
+            _finish_interrupted_key_swap(private_key, public_key)
+        except OSError:
+            pass
         if os.path.exists(private_key) and os.path.exists(public_key):
             try:
                 with open(public_key, "r") as f:
@@ -725,6 +954,53 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
             "public_key": public_key if exists else ""
         })
 
+    def _generate_ssh_key(email, private_key, public_key, log_label):
+        """Run ssh-keygen into temporary files, then swap them into place.
+
+        A failed keygen leaves the existing pair untouched. The two renames
+        are not atomic as a pair: if the server dies between them, the new
+        private key sits next to the old public key until the next key
+        check or keygen calls _finish_interrupted_key_swap.
+        """
+        new_private_key = f"{private_key}.new"
+        new_public_key = f"{new_private_key}.pub"
+        _finish_interrupted_key_swap(private_key, public_key)
+        # ssh-keygen prompts before overwriting, so clear any leftover temp pair
+        for leftover in (new_private_key, new_public_key):
+            try:
+                os.remove(leftover)
+            except FileNotFoundError:
+                pass
+
+        # Generate SSH key with no passphrase
+        result = run_command(
+            ["ssh-keygen", "-t", "ed25519", "-C", email, "-N", "", "-f", new_private_key],
+            timeout_s=15,
+            log_label=log_label,
+        )
+
+        if not result.ok:
+            error_msg = result.stderr.strip() or result.stdout.strip() or result.error or "Unknown error"
+            return jsonify({"success": False, "error": error_msg}), 500
+
+        try:
+            with open(new_public_key, "r") as f:
+                pub_key_content = f.read().strip()
+        except FileNotFoundError:
+            return jsonify({"success": False, "error": "Key generation succeeded but public key file not found"}), 500
+        # Private key first: _finish_interrupted_key_swap relies on this order
+        os.replace(new_private_key, private_key)
+        os.replace(new_public_key, public_key)
+
+        # Convert git remote to SSH if it was HTTPS
+        convert_result = _convert_git_remote_to_ssh()
+        return jsonify({
+            "success": True,
+            "public_key": pub_key_content,
+            "remote_type": convert_result["type"],
+            "remote_converted": convert_result.get("converted", False)
+        })
+
     @app.post("/api/generate-ssh-key")
     def api_generate_ssh_key():
         data = request.get_json() or {}
@@ -732,8 +1008,7 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
         
         # Sanitize email to prevent command injection
         # Only allow alphanumeric, @, ., -, _, +
-        import re
-        if not email or not re.match(r'^[\w.+-]+@[\w.-]+\.[a-zA-Z]{2,}$', email):
+        if not email or not _EMAIL_RE.match(email):
             return jsonify({"success": False, "error": "Invalid email address format"}), 400
         
         ssh_dir, private_key, public_key = _get_ssh_key_paths()
@@ -746,45 +1021,18 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
             # Ensure .ssh directory exists with proper permissions
             if not os.path.exists(ssh_dir):
                 os.makedirs(ssh_dir, mode=0o700)
-            
-            # Generate SSH key with no passphrase
-            result = run_command(
-                ["ssh-keygen", "-t", "ed25519", "-C", email, "-N", "", "-f", private_key],
-                timeout_s=15,
-                log_label="ssh_keygen",
-            )
-            
-            if not result.ok:
-                error_msg = result.stderr.strip() or result.stdout.strip() or result.error or "Unknown error"
-                return jsonify({"success": False, "error": error_msg}), 500
-            
-            # Read and return the public key
-            if os.path.exists(public_key):
-                with open(public_key, "r") as f:
-                    pub_key_content = f.read().strip()
-                # Convert git remote to SSH if it was HTTPS
-                convert_result = _convert_git_remote_to_ssh()
-                return jsonify({
-                    "success": True,
-                    "public_key": pub_key_content,
-                    "remote_type": convert_result["type"],
-                    "remote_converted": convert_result.get("converted", False)
-                })
-            else:
-                return jsonify({"success": False, "error": "Key generation succeeded but public key file not found"}), 500
-                
+            return _generate_ssh_key(email, private_key, public_key, "ssh_keygen")
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
     @app.post("/api/regenerate-ssh-key")
     def api_regenerate_ssh_key():
-        """Delete existing SSH keys and generate new ones."""
+        """Replace existing SSH keys with newly generated ones."""
         data = request.get_json() or {}
         email = data.get("email", "").strip()
         
         # Sanitize email to prevent command injection
-        import re
-        if not email or not re.match(r'^[\w.+-]+@[\w.-]+\.[a-zA-Z]{2,}$', email):
+        if not email or not _EMAIL_RE.match(email):
             return jsonify({"success": False, "error": "Invalid email address format"}), 400
         
         ssh_dir, private_key, public_key = _get_ssh_key_paths()
@@ -794,44 +1042,13 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
             return jsonify({"success": False, "error": "No existing SSH keys to regenerate"}), 400
         
         try:
-            # Delete existing keys
-            if os.path.exists(private_key):
-                os.remove(private_key)
-            if os.path.exists(public_key):
-                os.remove(public_key)
-            
-            # Generate new SSH key with no passphrase
-            result = run_command(
-                ["ssh-keygen", "-t", "ed25519", "-C", email, "-N", "", "-f", private_key],
-                timeout_s=15,
-                log_label="ssh_keygen_regen",
-            )
-            
-            if not result.ok:
-                error_msg = result.stderr.strip() or result.stdout.strip() or result.error or "Unknown error"
-                return jsonify({"success": False, "error": error_msg}), 500
-            
-            # Read and return the new public key
-            if os.path.exists(public_key):
-                with open(public_key, "r") as f:
-                    pub_key_content = f.read().strip()
-                # Convert git remote to SSH if it was HTTPS
-                convert_result = _convert_git_remote_to_ssh()
-                return jsonify({
-                    "success": True,
-                    "public_key": pub_key_content,
-                    "remote_type": convert_result["type"],
-                    "remote_converted": convert_result.get("converted", False)
-                })
-            else:
-                return jsonify({"success": False, "error": "Key generation succeeded but public key file not found"}), 500
-                
+            return _generate_ssh_key(email, private_key, public_key, "ssh_keygen_regen")
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
     def _get_git_remote_info():
         """Get git remote origin URL and determine if it's HTTPS or SSH."""
-        cwd = os.path.dirname(os.path.abspath(__file__))
+        cwd = _APP_DIR
         try:
             result = run_command(
                 build_git_command(["remote", "-v"], git_user=git_user),
@@ -864,8 +1081,7 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
         
         url = remote_info["url"]
         # Parse GitHub HTTPS URL: https://github.com/user/repo.git
-        import re
-        match = re.match(r'https://github\.com/([^/]+)/(.+?)(?:\.git)?$', url)
+        match = _GITHUB_HTTPS_RE.match(url)
         if not match:
             return {"converted": False, "type": "https", "error": "Could not parse GitHub URL"}
         
@@ -875,7 +1091,7 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
             repo = repo + '.git'
         ssh_url = f"git@github.com:{user}/{repo}"
         
-        cwd = os.path.dirname(os.path.abspath(__file__))
+        cwd = _APP_DIR
         try:
             result = run_command(
                 build_git_command(["remote", "set-url", "origin", ssh_url], git_user=git_user),
@@ -905,7 +1121,6 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
     @app.post("/api/generate-ssl-cert")
     def api_generate_ssl_cert():
         """Generate or regenerate SSL certificates using tailscale cert."""
-        import shutil
         
         # Check if tailscale is installed
         if not _check_tailscale_installed():
@@ -992,6 +1207,7 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
                     finally:
                         exit_code = process.wait()
                         combined_output = "\n".join(all_output_lines)
+                        _invalidate_git_status()
                         _git_debug_log(f"api_update_run: git pull finished with exit_code={exit_code}")
                         _git_debug_log(f"api_update_run: git output: {combined_output[:500]}")
                         updates_found = has_updates(combined_output)
@@ -1026,11 +1242,7 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
         
         # Validate interval (min 5 seconds, max 3600 seconds)
         try:
-            interval = int(interval)
-            if interval < 5:
-                interval = 5
-            elif interval > 3600:
-                interval = 3600
+            interval = max(5, min(3600, int(interval)))
         except (TypeError, ValueError):
             return jsonify({"success": False, "error": "Invalid interval value"}), 400
         
@@ -1135,8 +1347,7 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
             return jsonify({"success": False, "error": "Branch name is required"}), 400
         
         # Validate branch name (basic sanitization)
-        import re
-        if not re.match(r'^[\w./-]+$', branch):
+        if not _BRANCH_NAME_RE.match(branch):
             return jsonify({"success": False, "error": "Invalid branch name"}), 400
         
         _git_debug_log(f"api_switch_branch: Attempting to switch to branch '{branch}'")
@@ -1149,6 +1360,7 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
                 if result["success"]:
                     # Save the branch to config
                     config_store.set_value("git_branch", branch)
+                    _invalidate_git_status()
                     _git_debug_log(f"api_switch_branch: Successfully switched to branch '{branch}'")
                     return jsonify({
                         "success": True,
@@ -1170,15 +1382,7 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
     @app.post("/api/restart")
     def api_restart():
         # Alias for /api/reboot - kept for backward compatibility but redirects to reboot logic
-        def _do_reboot():
-            try:
-                time.sleep(0.25)
-                system_service.reboot()
-            except Exception:
-                raise
-
-        threading.Thread(target=_do_reboot, daemon=True).start()
-        return jsonify({"status": "rebooting"})
+        return api_reboot()
 
     @app.get("/system-management")
     def get_system_management():
@@ -1188,32 +1392,18 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
     @app.post("/api/reboot")
     def api_reboot():
         # Execute reboot command matching main_display.py implementation
-        def _do_reboot():
-            try:
-                time.sleep(0.25)
-                system_service.reboot()
-            except Exception:
-                raise
-
-        threading.Thread(target=_do_reboot, daemon=True).start()
+        _schedule_power_action(system_service.reboot)
         return jsonify({"status": "rebooting"})
 
     @app.post("/api/shutdown")
     def api_shutdown():
         # Execute shutdown command matching main_display.py implementation
-        def _do_shutdown():
-            try:
-                time.sleep(0.25)
-                system_service.shutdown()
-            except Exception:
-                raise
-
-        threading.Thread(target=_do_shutdown, daemon=True).start()
+        _schedule_power_action(system_service.shutdown)
         return jsonify({"status": "shutting down"})
 
     @app.get("/api/reboot-config")
     def api_get_reboot_config():
-        return jsonify({
+        return _conditional_json({
             "reboot_enabled": config_store.get_bool("reboot_enabled", False),
             "reboot_time": config_store.get_str("reboot_time", "12:00 AM")
         })
@@ -1307,7 +1497,9 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
 
         # Handle timezone setting (system-only, not saved to config)
         timezone = form.get("timezone")
-        if timezone:
+        # The form always posts the timezone; skip sudo timedatectl only when the
+        # detected system zone already matches (an undetectable zone is always set)
+        if timezone and timezone != _get_current_system_timezone():
             # Apply timezone system-wide via timedatectl
             try:
                 result = run_command(
@@ -1341,13 +1533,13 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
     def api_stations():
         line_code = request.args.get("line")
         stations = _get_stations_for_line(data_handler, line_code)
-        return jsonify(stations)
+        return _conditional_json(stations)
 
     @app.get("/api/directions")
     def api_directions():
         station_code = request.args.get("station")
         directions = _get_directions_for_station(data_handler, station_code)
-        return jsonify(directions)
+        return _conditional_json(directions)
 
     def _get_installed_fonts():
         """Get list of installed fonts with their file paths using fc-list.
@@ -1595,7 +1787,7 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
     def api_restart_app():
         """Restart the main display application."""
         try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
+            script_dir = _APP_DIR
             main_display_script = os.path.join(script_dir, "main_display.py")
             
             # Launch new instance of main_display.py
@@ -1627,16 +1819,11 @@ def start_web_settings_server(data_handler, host="0.0.0.0", port=443):
     
     # If SSL is enabled, start a redirect server on port 80 to redirect HTTP -> HTTPS
     if _ssl_enabled:
-        redirect_app = Flask(__name__ + "_redirect")
-        
-        @redirect_app.before_request
-        def redirect_to_https():
-            # Redirect all HTTP requests to HTTPS
-            return redirect(request.url.replace("http://", "https://", 1), code=301)
-        
         def _run_redirect():
-            redirect_app.run(host=host, port=80, threaded=True, use_reloader=False, debug=False)
-        
+            # Bind inside the thread so a busy port 80 does not stop the main server
+            redirect_server = ThreadingHTTPServer((host, 80), _HttpsRedirectHandler)
+            redirect_server.serve_forever()
+
         redirect_thread = threading.Thread(target=_run_redirect, daemon=True)
         redirect_thread.start()
     